@@ -15,6 +15,7 @@ from src.data_downloader import download_dataset, load_downloaded_data
 from src.data_cleaner import clean_dataset, clean_dataframe
 from src.database_handler import dataframe_to_sqlite, list_tables
 from src.data_analyzer import analyze_data, generate_insights
+from src.frame_meta import FrameMeta
 from src.plot_generator import generate_all_plots
 
 logging.basicConfig(
@@ -55,12 +56,12 @@ def run_pipeline(dataset_url=None, dataset_name='titanic'):
 
         # Clean data
         logger.info("Cleaning data...")
-        cleaned_file = clean_dataset(data_file)
-        if not cleaned_file:
+        cleaned = clean_dataset(data_file)
+        if not cleaned:
             logger.error("Failed to clean data")
             return False
 
-        df_clean = load_downloaded_data(cleaned_file)
+        cleaned_file, df_clean = cleaned
         logger.info(f"Cleaned data saved to: {cleaned_file}")
 
         # Store in database
@@ -76,15 +77,17 @@ def run_pipeline(dataset_url=None, dataset_name='titanic'):
 
         # Analyze data
         logger.info("Analyzing data...")
-        analysis_results = analyze_data(df_clean)
-        insights = generate_insights(df_clean)
+        meta = FrameMeta.from_df(df_clean)
+        corr = df_clean[meta.numeric_cols].corr() if not meta.numeric_cols.empty else None
+        analysis_results = analyze_data(df_clean, meta=meta, corr=corr)
+        insights = generate_insights(df_clean, meta=meta)
 
         for insight in insights:
             logger.info(f"    {insight}")
 
         #Generate plots
         logger.info("Step 5: Generating visualizations...")
-        plot_count = generate_all_plots(df_clean)
+        plot_count = generate_all_plots(df_clean, meta=meta, corr=corr)
         logger.info(f"Generated {plot_count} plots")
 
         # Final summary
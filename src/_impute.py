@@ -0,0 +1,48 @@
+"""
+Numeric Imputation Kernels
+Optional Numba-accelerated median imputation for large numeric frames.
+"""
+import numpy as np
+import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Frames with fewer numeric cells than this stay on the pandas path,
+# where JIT compilation time would dominate the actual fill.
+IMPUTE_SIZE_THRESHOLD = 250_000
+
+
+if NUMBA_AVAILABLE:
+    # No fastmath here: its nnan assumption constant-folds np.isnan to
+    # False and the kernel would stop seeing the NaNs it exists to fill
+    @njit(parallel=True, cache=True)
+    def _impute_median_kernel(arr):
+        n, m = arr.shape
+        for j in prange(m):
+            col = arr[:, j]
+            mask = np.isnan(col)
+            valid = col[~mask]
+            if valid.size == 0 or valid.size == n:
+                continue
+            med = np.median(valid)
+            for i in range(n):
+                if mask[i]:
+                    col[i] = med
+
+
+def impute_median(arr):
+    """
+    Fill NaNs in a 2-D float array with per-column medians, in place
+    Args:
+        arr: 2-D float64 array (columns are variables)
+    Returns:
+        The same array with NaNs replaced
+    """
+    _impute_median_kernel(arr)
+    return arr
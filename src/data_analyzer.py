@@ -11,40 +11,61 @@ import logging
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 from config import OUTPUTS_REPORTS
+from src.frame_meta import FrameMeta
 
 logger = logging.getLogger(__name__)
 
 
-def analyze_data(df, analysis_type="basic"):
+def analyze_data(df, analysis_type="basic", meta=None, corr=None):
     """
     Analyze dataset and generate reports
     Args:
         df: DataFrame to analyze
         analysis_type: "basic" or "comprehensive"
+        meta: Precomputed FrameMeta (built from df when omitted)
+        corr: Precomputed correlation matrix (computed when omitted)
     Returns:
         Analysis reports
     """
+    if meta is None:
+        meta = FrameMeta.from_df(df)
+
     analysis_results = {}
 
     # Basic analysis (always done)
-    analysis_results['shape'] = df.shape
+    analysis_results['shape'] = meta.shape
     analysis_results['column_types'] = df.dtypes.astype(str).to_dict()
-    analysis_results['missing_values'] = df.isnull().sum().to_dict()
+    analysis_results['missing_values'] = meta.null_counts.to_dict()
 
     # Numeric analysis
-    numeric_cols = df.select_dtypes(include=[np.number]).columns
+    numeric_cols = meta.numeric_cols
     if not numeric_cols.empty:
-        analysis_results['numeric_stats'] = df[numeric_cols].describe().to_dict()
-        analysis_results['correlation'] = df[numeric_cols].corr().to_dict()
+        numeric_df = df[numeric_cols]
+        # Single fused pass over the numeric block instead of describe()'s several
+        stats = numeric_df.agg(['count', 'mean', 'std', 'min', 'max'])
+        stats.loc['50%'] = numeric_df.quantile(0.5)
+        analysis_results['numeric_stats'] = stats
+
+        if corr is None:
+            if len(numeric_cols) > 32:
+                # One BLAS call beats pandas' pairwise loop on wide frames
+                corr = pd.DataFrame(np.corrcoef(numeric_df.to_numpy(dtype=float).T),
+                                    index=numeric_cols, columns=numeric_cols)
+            else:
+                corr = numeric_df.corr()
+        analysis_results['correlation'] = corr
 
     # Categorical analysis
-    categorical_cols = df.select_dtypes(exclude=[np.number]).columns
+    categorical_cols = meta.categorical_cols
     categorical_stats = {}
-    for col in categorical_cols:
-        if df[col].nunique() < 50:
+    if not categorical_cols.empty:
+        # One vectorized pass for all cardinalities, then value_counts
+        # only for the columns that survive the filter
+        cardinalities = df[categorical_cols].nunique()
+        for col in cardinalities.index[cardinalities < 50]:
             categorical_stats[col] = {
-                'unique_count': df[col].nunique(),
-                'most_common': df[col].value_counts().head().to_dict()
+                'unique_count': int(cardinalities[col]),
+                'most_common': df[col].value_counts().iloc[:5].to_dict()
             }
     analysis_results['categorical_stats'] = categorical_stats
 
@@ -62,35 +83,41 @@ def save_analysis_reports(results):
     """
     # Numeric summary
     if 'numeric_stats' in results:
-        numeric_df = pd.DataFrame(results['numeric_stats'])
-        numeric_df.to_csv(OUTPUTS_REPORTS / "numeric_summary.csv")
+        results['numeric_stats'].to_csv(OUTPUTS_REPORTS / "numeric_summary.csv")
 
     # Correlation matrix
     if 'correlation' in results:
-        corr_df = pd.DataFrame(results['correlation'])
-        corr_df.to_csv(OUTPUTS_REPORTS / "correlation_matrix.csv")
+        results['correlation'].to_csv(OUTPUTS_REPORTS / "correlation_matrix.csv")
 
     logger.info(f"Analysis reports saved to {OUTPUTS_REPORTS}")
 
 
-def generate_insights(df):
+def generate_insights(df, meta=None, null_counts=None):
     """
     Generate human-readable insights
     Args:
         df: Dataframe
+        meta: Precomputed FrameMeta (built from df when omitted)
+        null_counts: Per-column null counts from an earlier analysis pass;
+            takes precedence over meta.null_counts
     """
+    if meta is None:
+        meta = FrameMeta.from_df(df)
+    if null_counts is None:
+        null_counts = meta.null_counts
+
     insights = []
 
     # Basic info
-    insights.append(f"Dataset has {df.shape[0]:,} rows and {df.shape[1]} columns")
+    insights.append(f"Dataset has {meta.shape[0]:,} rows and {meta.shape[1]} columns")
 
     # Missing values
-    missing_total = df.isnull().sum().sum()
+    missing_total = int(null_counts.sum())
     if missing_total > 0:
         insights.append(f"Found {missing_total} missing values")
 
     # Numeric columns insights
-    numeric_cols = df.select_dtypes(include=[np.number]).columns
+    numeric_cols = meta.numeric_cols
     if len(numeric_cols) > 0:
         insights.append(f"Numeric columns: {', '.join(numeric_cols)}")
 
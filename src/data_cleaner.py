@@ -4,6 +4,8 @@ Handles data cleaning operations
 """
 import sys
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv
 import numpy as np
 from pathlib import Path
 import logging
@@ -11,9 +13,15 @@ import logging
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 from config import DATA_PROCESSED, DEFAULT_CLEANING
+from src._impute import NUMBA_AVAILABLE, IMPUTE_SIZE_THRESHOLD, impute_median
 
 logger = logging.getLogger(__name__)
 
+# Copy-on-write is the default from pandas 3; enable it on 2.x so
+# clean_dataframe can skip the eager full-frame copy safely.
+if pd.__version__ < "3":
+    pd.set_option("mode.copy_on_write", True)
+
 
 def clean_dataframe(df, strategy=None):
     """
@@ -27,7 +35,9 @@ def clean_dataframe(df, strategy=None):
     if strategy is None:
         strategy = DEFAULT_CLEANING
 
-    df_clean = df.copy()
+    # Shallow copy: free under copy-on-write, but keeps the caller's
+    # frame out of reach of the fill/promotion assignments below
+    df_clean = df.copy(deep=False)
     initial_shape = df_clean.shape
 
     logger.info(f"Starting cleaning: {initial_shape}")
@@ -42,29 +52,50 @@ def clean_dataframe(df, strategy=None):
 
     # Clean column names
     if strategy.get('strip_columns', True):
-        df_clean.columns = df_clean.columns.str.strip().str.replace(' ', '_').str.lower()
+        df_clean = df_clean.rename(columns=lambda c: c.strip().replace(' ', '_').lower())
 
     # Handle missing values
     numeric_cols = df_clean.select_dtypes(include=[np.number]).columns
     categorical_cols = df_clean.select_dtypes(exclude=[np.number]).columns
 
-    for col in numeric_cols:
-        if df_clean[col].isna().any():
-            method = strategy.get('handle_numeric_na', 'median')
-            if method == 'mean':
-                df_clean[col] = df_clean[col].fillna(df_clean[col].mean())
-            elif method == 'median':
-                df_clean[col] = df_clean[col].fillna(df_clean[col].median())
-            logger.info(f"Filled missing values in {col} with {method}")
-
-    for col in categorical_cols:
-        if df_clean[col].isna().any():
-            method = strategy.get('handle_categorical_na', 'mode')
-            if method == 'mode':
-                mode_val = df_clean[col].mode()
-                fill_val = mode_val[0] if not mode_val.empty else "Unknown"
-                df_clean[col] = df_clean[col].fillna(fill_val)
-            logger.info(f"Filled missing values in {col} with {method}")
+    numeric_method = strategy.get('handle_numeric_na', 'median')
+    if len(numeric_cols) > 0 and numeric_method in ('mean', 'median'):
+        # Only columns that actually contain NAs get touched, so NA-free
+        # columns keep their dtypes. Nullable integer columns would
+        # truncate a fractional mean/median fill; promote them to float,
+        # as the numpy CSV parser used to
+        na_cols = []
+        for col in numeric_cols:
+            if df_clean[col].isna().any():
+                na_cols.append(col)
+                col_dtype = df_clean[col].dtype
+                if pd.api.types.is_integer_dtype(col_dtype):
+                    float_dtype = ('float64[pyarrow]'
+                                   if isinstance(col_dtype, pd.ArrowDtype) else 'float64')
+                    df_clean[col] = df_clean[col].astype(float_dtype)
+
+        if na_cols:
+            numeric_cells = len(df_clean) * len(numeric_cols)
+            if (numeric_method == 'median' and NUMBA_AVAILABLE
+                    and numeric_cells >= IMPUTE_SIZE_THRESHOLD):
+                values = df_clean[na_cols].to_numpy(dtype=np.float64, copy=True)
+                impute_median(values)
+                df_clean[na_cols] = values
+            else:
+                if numeric_method == 'mean':
+                    fill_values = df_clean[na_cols].mean()
+                else:
+                    fill_values = df_clean[na_cols].median()
+                df_clean[na_cols] = df_clean[na_cols].fillna(fill_values)
+            logger.info(f"Filled missing numeric values with {numeric_method}")
+
+    if len(categorical_cols) > 0 and strategy.get('handle_categorical_na', 'mode') == 'mode':
+        modes = {}
+        for col in categorical_cols:
+            mode_val = df_clean[col].mode()
+            modes[col] = mode_val.iloc[0] if not mode_val.empty else "Unknown"
+        df_clean.fillna(modes, inplace=True)
+        logger.info("Filled missing categorical values with mode")
 
     logger.info(f"Cleaning complete: {df_clean.shape}")
     return df_clean
@@ -75,24 +106,34 @@ def clean_dataset(input_path, output_path=None, strategy=None):
     Complete cleaning pipeline for a CSV file
     Args:
         input_path: Path to CSV file
-        output_path: Path to output CSV file
+        output_path: Path to output file
         strategy: Cleaning strategy dictionary
     Returns:
-        Path to output CSV file or None if failed
+        Tuple of (output path, cleaned DataFrame) or None if failed
     """
     try:
-        df = pd.read_csv(input_path)
+        table = pa.csv.read_csv(
+            input_path,
+            read_options=pa.csv.ReadOptions(use_threads=True, block_size=8 << 20),
+            convert_options=pa.csv.ConvertOptions(strings_can_be_null=True)
+        )
+        df = table.to_pandas(types_mapper=pd.ArrowDtype, self_destruct=True)
         df_clean = clean_dataframe(df, strategy)
 
-        # Save cleaned data
+        # Save cleaned data; Parquet keeps dtypes and round-trips far
+        # faster than CSV
         if output_path is None:
             input_name = Path(input_path).stem
-            output_path = DATA_PROCESSED / f"{input_name}_cleaned.csv"
+            output_path = DATA_PROCESSED / f"{input_name}_cleaned.parquet"
 
-        df_clean.to_csv(output_path, index=False)
+        output_path = Path(output_path)
+        if output_path.suffix == '.csv':
+            df_clean.to_csv(output_path, index=False)
+        else:
+            df_clean.to_parquet(output_path, engine='pyarrow', compression='snappy')
         logger.info(f"Saved cleaned data to: {output_path}")
 
-        return output_path
+        return output_path, df_clean
 
     except Exception as e:
         logger.error(f"Cleaning pipeline failed: {e}")
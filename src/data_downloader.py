@@ -3,8 +3,11 @@ Data Downloader Module
 Handles downloading datasets from URLs or loading from local files.
 """
 import sys
+import shutil
 import requests
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv
 import logging
 from pathlib import Path
 
@@ -38,9 +41,6 @@ def download_dataset(url=None, dataset_name=None, save_path=None):
 
         logger.info(f"Downloading from: {url}")
 
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-
         #determining file name for the downloaded file
         if save_path:
             filename = save_path
@@ -51,8 +51,12 @@ def download_dataset(url=None, dataset_name=None, save_path=None):
             else:
                 filename = DATA_RAW / "downloaded_dataset.csv"
 
-        with open(filename, "wb") as f:
-            f.write(response.content)
+        #stream 1 MiB chunks straight from socket to disk
+        with requests.get(url, stream=True, timeout=10) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            with open(filename, "wb") as f:
+                shutil.copyfileobj(response.raw, f, length=1 << 20)
 
         logger.info(f"Downloaded to: {filename}")
         return filename
@@ -71,7 +75,28 @@ def load_downloaded_data(file_path):
         None
     """
     try:
-        df = pd.read_csv(file_path)
+        file_path = Path(file_path)
+        if file_path.suffix == '.parquet':
+            # Already typed and compressed; no downcasting needed
+            df = pd.read_parquet(file_path, engine='pyarrow', dtype_backend='pyarrow')
+        else:
+            table = pa.csv.read_csv(
+                file_path,
+                read_options=pa.csv.ReadOptions(use_threads=True, block_size=8 << 20),
+                convert_options=pa.csv.ConvertOptions(strings_can_be_null=True)
+            )
+            df = table.to_pandas(types_mapper=pd.ArrowDtype, self_destruct=True)
+
+            # Shrink numeric widths and dictionary-encode low-cardinality strings
+            for col in df.select_dtypes('integer').columns:
+                df[col] = pd.to_numeric(df[col], downcast='integer')
+            for col in df.select_dtypes('float').columns:
+                df[col] = pd.to_numeric(df[col], downcast='float')
+            if len(df) > 0:
+                for col in df.select_dtypes(include=['object', 'string']).columns:
+                    if df[col].nunique() / len(df) < 0.5:
+                        df[col] = df[col].astype('category')
+
         logger.info(f"Loaded data: {df.shape[0]} rows, {df.shape[1]} columns")
         return df
     except Exception as e:
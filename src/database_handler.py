@@ -4,6 +4,8 @@ Manages SQLite database operations for storing and querying data.
 """
 
 import sys
+import re
+import functools
 import sqlite3
 from pathlib import Path
 import pandas as pd
@@ -15,11 +17,37 @@ sys.path.insert(0, str(project_root))
 from config import DATABASE_PATH
 logger = logging.getLogger(__name__)
 
+# Optional: ADBC bulk-ingests Arrow batches through the native SQLite
+# API, skipping per-cell Python boxing
+try:
+    import pyarrow as pa
+    import adbc_driver_sqlite.dbapi as adbc
+    ADBC_AVAILABLE = True
+except ImportError:
+    ADBC_AVAILABLE = False
+
+_TABLE_NAME_RE = re.compile(r'[^0-9A-Za-z_]')
+
+_ADBC_INGEST_MODES = {'replace': 'replace', 'append': 'append', 'fail': 'create'}
+
 
 def setup_database():
     """Initialize database and ensure tables exist"""
     DATABASE_PATH.parent.mkdir(parents=True, exist_ok=True)
-    return sqlite3.connect(DATABASE_PATH)
+    conn = sqlite3.connect(DATABASE_PATH)
+    # WAL + relaxed sync amortize fsync cost across batched inserts
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA cache_size=-65536")
+    return conn
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_conn():
+    """Shared connection reused across read-only queries; write paths
+    keep their own short-lived transactional connections"""
+    DATABASE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    return sqlite3.connect(DATABASE_PATH, check_same_thread=False)
 
 
 def dataframe_to_sqlite(df, table_name, if_exists='replace'):
@@ -31,11 +59,26 @@ def dataframe_to_sqlite(df, table_name, if_exists='replace'):
         if_exists: 'fail', 'replace', or 'append'
     """
     try:
+        table_name = clean_table_name(table_name)
+
+        if ADBC_AVAILABLE and if_exists in _ADBC_INGEST_MODES:
+            DATABASE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with adbc.connect(str(DATABASE_PATH)) as conn:
+                with conn.cursor() as cur:
+                    cur.adbc_ingest(table_name,
+                                    pa.Table.from_pandas(df, preserve_index=False),
+                                    mode=_ADBC_INGEST_MODES[if_exists])
+                conn.commit()
+            logger.info(f"Saved {len(df)} rows to table '{table_name}'")
+            return table_name
+
         with setup_database() as conn:
-            table_name = clean_table_name(table_name)
-            df.to_sql(table_name, conn, if_exists=if_exists, index=False)
-            count = pd.read_sql(f"SELECT COUNT(*) as count FROM {table_name}", conn)
-            logger.info(f"Saved {count.iloc[0]['count']} rows to table '{table_name}'")
+            # Multi-row inserts, capped so each statement stays under
+            # SQLite's bound-variable limit
+            chunksize = max(1, 32_000 // max(1, len(df.columns)))
+            df.to_sql(table_name, conn, if_exists=if_exists, index=False,
+                      method='multi', chunksize=chunksize)
+            logger.info(f"Saved {len(df)} rows to table '{table_name}'")
 
             return table_name
 
@@ -52,12 +95,7 @@ def clean_table_name(name):
     Returns:
           cleaned table name
     """
-    filtered_chars = []
-    for characters in name:
-        if characters.isalnum() or characters == '_':
-            filtered_chars.append(characters)
-    result = ''.join(filtered_chars).lower()
-    return result
+    return _TABLE_NAME_RE.sub('', name).lower()
 
 
 def run_sql_query(query):
@@ -67,14 +105,27 @@ def run_sql_query(query):
         query: SQL query
     """
     try:
-        with setup_database() as conn:
-            df = pd.read_sql_query(query, conn)
-            return df
+        return pd.read_sql_query(query, _shared_conn())
     except Exception as e:
         logger.error(f"Query failed: {e}")
         return None
 
 
+def run_sql_raw(query):
+    """
+    Run SQL query and return raw result tuples, skipping DataFrame construction
+    Args:
+        query: SQL query
+    Returns:
+        List of result tuples (empty on failure)
+    """
+    try:
+        return _shared_conn().execute(query).fetchall()
+    except Exception as e:
+        logger.error(f"Query failed: {e}")
+        return []
+
+
 def get_table_info(table_name):
     """
     Get information about a table
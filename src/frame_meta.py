@@ -0,0 +1,34 @@
+"""
+Frame Metadata Module
+Caches per-DataFrame column and null-count information so pipeline
+stages don't each re-scan dtypes and missing values.
+"""
+from dataclasses import dataclass
+
+import pandas as pd
+import numpy as np
+
+
+@dataclass
+class FrameMeta:
+    """Column lists and null counts computed once per DataFrame"""
+    numeric_cols: pd.Index
+    categorical_cols: pd.Index
+    null_counts: pd.Series
+    shape: tuple
+
+    @classmethod
+    def from_df(cls, df):
+        """
+        Build metadata from a DataFrame in a single pass over its dtypes
+        Args:
+            df: DataFrame to inspect
+        Returns:
+            FrameMeta instance
+        """
+        return cls(
+            numeric_cols=df.select_dtypes(include=[np.number]).columns,
+            categorical_cols=df.select_dtypes(exclude=[np.number]).columns,
+            null_counts=df.isnull().sum(),
+            shape=df.shape,
+        )
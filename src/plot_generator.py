@@ -3,14 +3,20 @@ Plot Generator Module
 Generates visualizations for data analysis.
 """
 import sys
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
+import pandas as pd
 import seaborn as sns
 import logging
 
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 from config import OUTPUTS_PLOTS
+from src.frame_meta import FrameMeta
 
 logger = logging.getLogger(__name__)
 
@@ -22,39 +28,63 @@ def setup_plotting():
     plt.rcParams['figure.figsize'] = (10, 6)
 
 
-def create_distribution_plots(df, max_columns=8):
-    """Create distribution plots for numeric columns"""
-    setup_plotting()
-    numeric_columns = df.select_dtypes(include=['number']).columns
+def _render_distribution(values, column, as_histogram, output_path):
+    """Render a single distribution plot (runs in a worker process)"""
+    try:
+        setup_plotting()
+
+        series = pd.Series(values, name=column)
+        plt.figure(figsize=(8, 5))
+        if as_histogram:
+            series.hist(bins=30, alpha=0.7, edgecolor='black')
+            plt.title(f'Distribution of {column}')
+            plt.ylabel('Frequency')
+        else:
+            series.value_counts().sort_index().plot(kind='bar', alpha=0.7)
+            plt.title(f'Value Counts of {column}')
+            plt.ylabel('Count')
+
+        plt.xlabel(column)
+        plt.xticks(rotation=45)
+        plt.tight_layout()
+        plt.savefig(output_path, dpi=100, pil_kwargs={'compress_level': 1})
+        plt.close()
+        return column, None
+
+    except Exception as e:
+        return column, str(e)
+
+
+def create_distribution_plots(df, max_columns=8, meta=None):
+    """Create distribution plots for numeric columns, one worker per column"""
+    if meta is None:
+        meta = FrameMeta.from_df(df)
+    numeric_columns = meta.numeric_cols
 
     # Limit number of plots
     columns_to_plot = numeric_columns[:max_columns]
+    if columns_to_plot.empty:
+        return
+
+    # Raw NumPy arrays keep the pickled task payloads small
+    tasks = [(df[column].to_numpy(), column,
+              df[column].nunique() > 20,
+              OUTPUTS_PLOTS / f"{column}_distribution.png")
+             for column in columns_to_plot]
+
+    # Spawned (not forked) workers: forking after the numba threading
+    # layer has initialized deadlocks the child at shutdown
+    with ProcessPoolExecutor(mp_context=multiprocessing.get_context('spawn')) as executor:
+        for column, error in executor.map(_render_distribution, *zip(*tasks)):
+            if error:
+                logger.warning(f"Could not plot {column}: {error}")
+
 
-    for column in columns_to_plot:
-        try:
-            plt.figure()
-            if df[column].nunique() > 20:
-                df[column].hist(bins=30, alpha=0.7, edgecolor='black')
-                plt.title(f'Distribution of {column}')
-                plt.ylabel('Frequency')
-            else:
-                df[column].value_counts().sort_index().plot(kind='bar', alpha=0.7)
-                plt.title(f'Value Counts of {column}')
-                plt.ylabel('Count')
-
-            plt.xlabel(column)
-            plt.xticks(rotation=45)
-            plt.tight_layout()
-            plt.savefig(OUTPUTS_PLOTS / f"{column}_distribution.png", dpi=150, bbox_inches='tight')
-            plt.close()
-
-        except Exception as e:
-            logger.warning(f"Could not plot {column}: {e}")
-
-
-def create_correlation_heatmap(df):
+def create_correlation_heatmap(df, meta=None, corr=None):
     """Create correlation heatmap for numeric columns"""
-    numeric_columns = df.select_dtypes(include=['number']).columns
+    if meta is None:
+        meta = FrameMeta.from_df(df)
+    numeric_columns = meta.numeric_cols
 
     if len(numeric_columns) < 2:
         logger.info("Not enough numeric columns for correlation heatmap")
@@ -62,47 +92,60 @@ def create_correlation_heatmap(df):
 
     try:
         plt.figure(figsize=(10, 8))
-        corr_matrix = df[numeric_columns].corr()
+        corr_matrix = corr if corr is not None else df[numeric_columns].corr()
 
         sns.heatmap(corr_matrix, annot=True, cmap='coolwarm', center=0,
                     fmt='.2f', square=True, linewidths=0.5)
         plt.title('Correlation Heatmap')
         plt.tight_layout()
-        plt.savefig(OUTPUTS_PLOTS / "correlation_heatmap.png", dpi=150, bbox_inches='tight')
+        plt.savefig(OUTPUTS_PLOTS / "correlation_heatmap.png", dpi=100,
+                    pil_kwargs={'compress_level': 1})
         plt.close()
 
     except Exception as e:
         logger.error(f"Failed to create correlation heatmap: {e}")
 
 
-def create_categorical_plots(df, max_categories=10):
+def create_categorical_plots(df, max_categories=10, meta=None):
     """Create plots for categorical columns"""
-    categorical_columns = df.select_dtypes(exclude=['number']).columns
-
-    for column in categorical_columns:
-        if df[column].nunique() <= max_categories:
-            try:
-                plt.figure()
-                df[column].value_counts().plot(kind='bar', alpha=0.7)
-                plt.title(f'Distribution of {column}')
-                plt.ylabel('Count')
-                plt.xticks(rotation=45)
-                plt.tight_layout()
-                plt.savefig(OUTPUTS_PLOTS / f"{column}_distribution.png", dpi=150, bbox_inches='tight')
-                plt.close()
-            except Exception as e:
-                logger.warning(f"Could not plot categorical {column}: {e}")
-
-
-def generate_all_plots(df):
+    if meta is None:
+        meta = FrameMeta.from_df(df)
+    categorical_columns = meta.categorical_cols
+
+    # One figure reused across columns; allocating a fresh canvas per
+    # plot costs more than the drawing itself
+    fig, ax = plt.subplots(figsize=(8, 5))
+    try:
+        for column in categorical_columns:
+            if df[column].nunique() <= max_categories:
+                try:
+                    ax.clear()
+                    df[column].value_counts().plot(kind='bar', alpha=0.7, ax=ax)
+                    ax.set_title(f'Distribution of {column}')
+                    ax.set_ylabel('Count')
+                    ax.tick_params(axis='x', rotation=45)
+                    fig.tight_layout()
+                    fig.savefig(OUTPUTS_PLOTS / f"{column}_distribution.png", dpi=100,
+                                pil_kwargs={'compress_level': 1})
+                except Exception as e:
+                    logger.warning(f"Could not plot categorical {column}: {e}")
+    finally:
+        plt.close(fig)
+
+
+def generate_all_plots(df, meta=None, corr=None):
     """Generate comprehensive set of plots"""
     logger.info("Generating visualizations...")
 
+    setup_plotting()
     OUTPUTS_PLOTS.mkdir(parents=True, exist_ok=True)
 
-    create_distribution_plots(df)
-    create_correlation_heatmap(df)
-    create_categorical_plots(df)
+    if meta is None:
+        meta = FrameMeta.from_df(df)
+
+    create_distribution_plots(df, meta=meta)
+    create_correlation_heatmap(df, meta=meta, corr=corr)
+    create_categorical_plots(df, meta=meta)
 
     # Count generated plots
     plot_count = len(list(OUTPUTS_PLOTS.glob("*.png")))
@@ -86,6 +86,25 @@ class TestDataPipeline:
         assert analysis_results['shape'] == (5, 5)
         assert 'numeric_stats' in analysis_results
 
+    def test_numba_impute_kernel(self):
+        """Test that the optional numba kernel really fills NaNs with medians"""
+        pytest.importorskip("numba")
+        import numpy as np
+        from src._impute import impute_median
+
+        rng = np.random.default_rng(0)
+        arr = rng.random((1000, 4))
+        arr[rng.random((1000, 4)) < 0.05] = np.nan
+        assert np.isnan(arr).sum() > 0
+
+        nan_mask = np.isnan(arr)
+        expected = np.nanmedian(arr, axis=0)
+        impute_median(arr)
+
+        assert np.isnan(arr).sum() == 0
+        for j in range(arr.shape[1]):
+            assert (arr[nan_mask[:, j], j] == expected[j]).all()
+
     def test_plot_generation(self):
         """Test plot generation (should not crash)"""
         # This just tests that plots can be generated without errors
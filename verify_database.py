@@ -11,7 +11,7 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent))
 
 from config import DATABASE_PATH
-from src.database_handler import list_tables, run_sql_query
+from src.database_handler import list_tables, run_sql_query, run_sql_raw, setup_database
 
 
 def print_header(text):
@@ -38,10 +38,9 @@ def verify_database():
             return False
 
         print("\nAvailable Tables:")
-        for table in tables:
-            count_result = run_sql_query(f"SELECT COUNT(*) as count FROM {table}")
-            if count_result is not None:
-                count = count_result.iloc[0]['count']
+        with setup_database() as conn:
+            for table in tables:
+                count = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
                 print(f"    {table} ({count} rows)")
 
         # Check each table
@@ -65,30 +64,34 @@ def verify_table(table_name):
     print_header(f"VERIFYING TABLE: {table_name}")
 
     try:
-        # Get table schema
-        schema = run_sql_query(f"PRAGMA table_info({table_name})")
-        if schema is not None:
+        # Get table schema (raw tuples: cid, name, type, notnull, default, pk)
+        schema = run_sql_raw(f"PRAGMA table_info({table_name})")
+        columns = [row[1] for row in schema]
+        if schema:
             print(f"\n Table Schema:")
-            print(schema.to_string(index=False))
+            for row in schema:
+                print(f"    {row[1]} ({row[2] or 'ANY'})")
 
         # Get sample data
-        sample_data = run_sql_query(f"SELECT * FROM {table_name} LIMIT 3")
-        if sample_data is not None:
+        sample_data = run_sql_raw(f"SELECT * FROM {table_name} LIMIT 3")
+        if sample_data:
             print(f"\n Sample Data (first 3 rows):")
-            print(sample_data.to_string(index=False))
+            print("    " + " | ".join(columns))
+            for row in sample_data:
+                print("    " + " | ".join(str(value) for value in row))
 
         # Basic statistics
-        stats = run_sql_query(f"""
-            SELECT 
+        stats = run_sql_raw(f"""
+            SELECT
                 COUNT(*) as total_rows,
-                COUNT(*) - COUNT(*) as null_count,  
                 MIN(rowid) as first_id,
                 MAX(rowid) as last_id
             FROM {table_name}
         """)
-        if stats is not None:
+        if stats:
+            total_rows, first_id, last_id = stats[0]
             print(f"\n Basic Statistics:")
-            print(stats.to_string(index=False))
+            print(f"    total_rows={total_rows} first_id={first_id} last_id={last_id}")
 
     except Exception as e:
         print(f"  Could not verify table {table_name}: {e}")
@@ -162,16 +165,13 @@ def run_example_queries(tables):
 def get_numeric_columns(table_name):
     """Get list of numeric columns in a table"""
     try:
-        # Sample data to infer types
-        sample = run_sql_query(f"SELECT * FROM {table_name} LIMIT 1")
-        if sample is not None:
-            numeric_cols = []
-            for col in sample.columns:
-                # Simple heuristic: if first value looks numeric
-                first_val = sample.iloc[0][col]
-                if first_val is not None and isinstance(first_val, (int, float)):
-                    numeric_cols.append(col)
-            return numeric_cols
+        # Sample one row to infer types
+        sample = run_sql_raw(f"SELECT * FROM {table_name} LIMIT 1")
+        columns = get_all_columns(table_name)
+        if sample and columns:
+            # Simple heuristic: if first value looks numeric
+            return [col for col, value in zip(columns, sample[0])
+                    if value is not None and isinstance(value, (int, float))]
     except:
         pass
     return []
@@ -180,9 +180,8 @@ def get_numeric_columns(table_name):
 def get_all_columns(table_name):
     """Get all column names for a table"""
     try:
-        schema = run_sql_query(f"PRAGMA table_info({table_name})")
-        if schema is not None:
-            return schema['name'].tolist()
+        schema = run_sql_raw(f"PRAGMA table_info({table_name})")
+        return [row[1] for row in schema]
     except:
         pass
     return []